@@ -13,7 +13,7 @@ from dataclasses import dataclass
 """"""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""""
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecReport:
     avg_px: float; filled: float; fee_bps: float; liquidity: str  # 'taker' or 'maker'
 
@@ -26,9 +26,9 @@ class ExecutionY:
         # Return avg fill px, filled qty, taker fee
         fee = self.cfg.fees_y.taker_bps
         # Pseudocode: result = await venue.order(...)
-        return ExecReport(avg_px=ref_px*(1 + (max_slippage_bps/1e4 if side=="buy" else -max_slippage_bps/1e4)),
-                          filled=qty, fee_bps=fee, liquidity="taker")
+        # side is +1/-1, so the guard is a signed multiply: buys pay up, sells give up
+        return ExecReport(ref_px*(1 + side*max_slippage_bps*1e-4), qty, fee, "taker")
 
     async def post_maker(self, side:Side, px:float, qty:float)->ExecReport:
         # Post passive; here we simulate immediate pass for outline
-        return ExecReport(avg_px=px, filled=qty, fee_bps=0.0, liquidity="maker")
+        return ExecReport(px, qty, 0.0, "maker")
@@ -1,33 +1,45 @@
+import asyncio
 from .plumbing.config import AppConfig
-from .plumbing.types import Side
+from .plumbing.types import Side, side_to_sign
 from .execution_y import ExecutionY, ExecReport
 
+class HedgeLegError(Exception):
+    # raised after every hedge leg has finished; reports holds the legs that did execute on Y
+    def __init__(self, reports:list[ExecReport], errors:list[BaseException]):
+        super().__init__(f"{len(errors)} hedge leg(s) failed: {errors[0]!r}")
+        self.reports = reports
+        self.errors = errors
+
 class Hedger:
     def __init__(self, cfg:AppConfig, exec_y:ExecutionY):
         self.cfg = cfg
         self.exec = exec_y
+        self._post_frac = cfg.hedge.post_bps_from_micro * 1e-4  # bps -> fraction, once
 
     async def hedge_fill(self, side_on_x:Side, qty:float, ref_px:float)->list[ExecReport]:
         # if we sold on X, we must buy on Y; if we bought on X, we must sell on Y
-        hedge_side = "buy" if side_on_x=="sell" else "sell"
+        hedge_side = -side_to_sign(side_on_x)
         taker_qty = qty * self.cfg.hedge.taker_fraction
         maker_qty = qty - taker_qty
-        reports = []
+        legs = []  # independent sends on Y; fired together, reports keep taker-then-maker order
 
         if taker_qty > 0:
-            rep = await self.exec.ioc_cross(
+            legs.append(self.exec.ioc_cross(
                 side=hedge_side,
                 qty=taker_qty,
                 ref_px=ref_px,
                 max_slippage_bps=self.cfg.hedge.max_slippage_bps
-            )
-            reports.append(rep)
+            ))
 
         if maker_qty > 0:
-            # post around micro +/- bps
-            post_px = ref_px * (1 - self.cfg.hedge.post_bps_from_micro/1e4 if hedge_side=="buy"
-                                else 1 + self.cfg.hedge.post_bps_from_micro/1e4)
-            rep = await self.exec.post_maker(hedge_side, maker_qty, post_px)  # type: ignore
-            reports.append(rep)
+            # post around micro +/- bps: below for buys, above for sells
+            post_px = ref_px * (1 - hedge_side*self._post_frac)
+            legs.append(self.exec.post_maker(side=hedge_side, px=post_px, qty=maker_qty))
 
+        # let every leg finish so a fill on Y is never dropped because its sibling raised
+        results = await asyncio.gather(*legs, return_exceptions=True)
+        reports = [r for r in results if not isinstance(r, BaseException)]
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            raise HedgeLegError(reports, errors) from errors[0]
         return reports
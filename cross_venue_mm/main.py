@@ -1,7 +1,46 @@
 import asyncio
 from .plumbing.config import AppConfig
 from .plumbing.wiring import App
+from .plumbing.binanceintegration import close_shared_connector
 from .plumbing.types import FillOnX
+from .plumbing.utils import setup_logger
+from .hedger import HedgeLegError
+from .pnl import compute_pnl, TradePnL
+
+log = setup_logger()
+
+async def _run_until_first_error(*coros):
+    # structured concurrency: one task failing cancels its siblings
+    if hasattr(asyncio, "TaskGroup"):  # py3.11+
+        async with asyncio.TaskGroup() as tg:
+            for c in coros:
+                tg.create_task(c)
+        return
+    tasks = [asyncio.ensure_future(c) for c in coros]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+async def _on_fill_x(app:App, fill:FillOnX)->TradePnL:
+    # Hedge at Y using microprice as ref
+    book = app.md_y.last_book()
+    ref_px = (book.bid_px+book.ask_px)/2 if book else fill.px
+    app.maker_x.on_fill(fill.side)  # reopen the epsilon gate for the filled side
+    # record the X fill before hedging so a failed hedge leg cannot lose it
+    app.fills_x.push(fill)  # FillOnX field order matches FILL_DT
+    # Update inventory
+    app.inv.qty += fill.side * fill.sz  # we sold -> -qty; we bought -> +qty
+    try:
+        reps = await app.hedger.hedge_fill(fill.side, fill.sz, ref_px)
+    except HedgeLegError as e:
+        # book the legs that did execute on Y and keep quoting; the shortfall is logged, not retried
+        reps = e.reports
+        hedged = sum(r.filled for r in reps)
+        log.error("hedge of X fill %s left %.8g of %.8g unhedged: %s", fill.order_id, fill.sz - hedged, fill.sz, e)
+    return compute_pnl(fill, reps)
 
 async def main():
     cfg = AppConfig()   #defines the configuration in config.py
@@ -29,20 +68,18 @@ async def main():
         # Pseudocode: subscribe to fills on X
         while True:
             fill = await FillOnX()  # returns FillOnX
-            # Hedge at Y using microprice as ref
-            book = app.md_y.last_book()
-            ref_px = (book.bid_px+book.ask_px)/2 if book else fill.px
-            reps = await app.hedger.hedge_fill(fill.side, fill.sz, ref_px)
-            # Update inventory
-            app.inv.qty += (-fill.sz if fill.side=="sell" else fill.sz)  # we sold -> -qty; we bought -> +qty
-            # Compute pnl, log
-            # pnl = compute_pnl(fill, reps)  # optional logging
-
-    await asyncio.gather(
-        app.md_y.run(on_book=on_book_y, on_trade=on_trade_y),
-        quoting_loop(),
-        hedge_on_fill_listener(),
-    )
+            pnl = await _on_fill_x(app, fill)
+            log.info("X fill %s hedged: net %.2f usd", fill.order_id, pnl.net_usd)
+
+    try:
+        await _run_until_first_error(
+            app.md_y.run(on_book=on_book_y, on_trade=on_trade_y),
+            quoting_loop(),
+            hedge_on_fill_listener(),
+        )
+    finally:
+        await app.md_y.close()
+        await close_shared_connector()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -1,36 +1,72 @@
 from collections import deque
 from math import log, sqrt
+import numpy as np
 from ..plumbing.types import BookTop
 
 class RollingVWAP:
     def __init__(self, n_trades:int=100):
-        self.prq = deque(maxlen=n_trades)
+        self.n = n_trades
+        self._p = deque(maxlen=n_trades)
+        self._s = deque(maxlen=n_trades)
         self.vol = 0.0
         self.dol = 0.0
     def update(self, price:float, size:float):
-        self.prq.append((price, size))
+        if len(self._p) == self.n:
+            # the oldest trade is evicted by the appends below; take it out of the sums
+            self.vol -= self._s[0]; self.dol -= self._p[0]*self._s[0]
+        self._p.append(price); self._s.append(size)
         self.vol += size; self.dol += price*size
     @property
     def value(self)->float:
         return self.dol / self.vol if self.vol>0 else None
 
 def microprice(book: BookTop) -> float:
-    db, da = book.bid_sz, book.ask_sz
-    return (book.bid_px*da + book.ask_px*db) / (da+db) if (da+db)>0 else (book.bid_px+book.ask_px)/2
+    return microprice_px(book.bid_px, book.bid_sz, book.ask_px, book.ask_sz)
+
+def microprice_px(bid_px:float, bid_sz:float, ask_px:float, ask_sz:float)->float:
+    # field-level microprice for hot paths that already hold the top of book unpacked
+    depth = bid_sz + ask_sz
+    return (bid_px*ask_sz + ask_px*bid_sz) / depth if depth>0 else (bid_px+ask_px)/2
+
+def microprice_batch(bid_px:np.ndarray, bid_sz:np.ndarray, ask_px:np.ndarray, ask_sz:np.ndarray)->np.ndarray:
+    # vectorized microprice over whole frames (backtests/replay); falls back to mid where depth is zero
+    denom = bid_sz + ask_sz
+    has_depth = denom > 0
+    return np.where(has_depth, (bid_px*ask_sz + ask_px*bid_sz) / np.where(has_depth, denom, 1.0),
+                    0.5*(bid_px + ask_px))
 
 class RollingVol:
     def __init__(self, window_secs:int, step_ms:int=1000):
         self.step_ms = step_ms
         self.window = int(1000*window_secs/step_ms)
-        self.returns = deque(maxlen=self.window)
+        # preallocated ring buffer of log returns: _n live samples, _i next write slot
+        self._buf = np.zeros(self.window, dtype=np.float64)
+        self._i = 0
+        self._n = 0
         self.last_px = None
+        # running sums over the window so sigma_bps is O(1)
+        self._sum = 0.0
+        self._sumsq = 0.0
     def update(self, last_trade_px:float):
         if self.last_px is not None and last_trade_px>0:
-            self.returns.append(log(last_trade_px/self.last_px))
+            r = log(last_trade_px/self.last_px)
+            if self._n == self.window:
+                old = float(self._buf[self._i])  # slot about to be overwritten
+                self._sum -= old; self._sumsq -= old*old
+            else:
+                self._n += 1
+            self._buf[self._i] = r
+            self._sum += r; self._sumsq += r*r
+            self._i += 1
+            if self._i == self.window:
+                # once per lap, re-anchor the running sums to shed accumulated rounding
+                self._i = 0
+                live = self._buf[:self._n]
+                self._sum = float(live.sum()); self._sumsq = float(live @ live)
         self.last_px = last_trade_px
     def sigma_bps(self)->float:
-        if not self.returns: return 0.0
-        n = len(self.returns); mu = sum(self.returns)/n
-        var = sum((r-mu)**2 for r in self.returns)/(max(1,n-1))
+        n = self._n
+        if not n: return 0.0
+        var = max(0.0, self._sumsq - self._sum*self._sum/n)/(max(1,n-1))
         # convert to bps per step, then per second (approx)
         return sqrt(var)*1e4
@@ -9,9 +9,14 @@ class InventorySkew:
     def __init__(self, gamma:float, horizon_secs:int):
         self.gamma = gamma
         self.horizon_secs = horizon_secs
+        # eta only moves with sigma, which is constant between vol updates; memo the last one
+        self._last_sigma_bps: float|None = None
+        self._last_eta = 0.0
     def reservation_skew(self, sigma_bps:float, inventory_qty:float, px:float)->float:
-        # eta ~ gamma * sigma^2 * T ; convert sigma_bps to fraction
-        sigma = sigma_bps/1e4
-        eta = self.gamma * (sigma**2) * (self.horizon_secs/60)  # scale loosely
+        if sigma_bps != self._last_sigma_bps:
+            # eta ~ gamma * sigma^2 * T ; convert sigma_bps to fraction
+            sigma = sigma_bps/1e4
+            self._last_eta = self.gamma * (sigma**2) * (self.horizon_secs/60)  # scale loosely
+            self._last_sigma_bps = sigma_bps
         # r = S - eta*q  -> return skew in price units
-        return -eta * inventory_qty * px
+        return -self._last_eta * inventory_qty * px
@@ -1,39 +1,101 @@
-from dataclasses import dataclass
+from math import sqrt
+from typing import NamedTuple
+import numpy as np
 from ..plumbing.config import AppConfig
-from .indicators import microprice
-from ..plumbing.types import BookTop
+from .indicators import microprice_px, microprice_batch
+from ..plumbing.types import BookTop, BookTopBatch
 
-@dataclass
-class Quote:
+_INV_1E4 = 1e-4  # bps -> fraction
+
+class Quote(NamedTuple):
+    # tuple-backed return record: attribute and index access, no per-instance dict
     bid: float; ask: float; mid_ref: float; half_spread_bps: float
 
+# pricing rules, written once and shared by the scalar kernel and the batch path:
+# plain arithmetic, so they take Python floats or numpy arrays alike (the batch path
+# passes np.sqrt and writes the final quotes through _skewed_quotes_into)
+
+def _exp_slippage_bps(size_usd, top_sz, mid):
+    # crude: assume cross top, if not enough depth, pay 1-2 bps extra
+    return 1.0 + (size_usd > top_sz * mid)
+
+def _vol_term_bps(sigma_bps, sqrt=sqrt):
+    # light vol sensitivity; callers clamp sigma_bps at 0
+    return 0.35 * sqrt(sigma_bps)
+
+def _size_curve_bps(size_usd:float, ref_size_usd:float, size_exp:float)->float:
+    # convex size premium: k * (size/25k)^(exp-1), k = 1
+    return max(0.0, (size_usd / ref_size_usd)**size_exp)
+
+def _skewed_quotes(m, inv_skew_px, h_bps):
+    # reservation price shift, then the half-spread either side
+    r = m + inv_skew_px
+    h = h_bps * _INV_1E4
+    return r * (1 - h), r * (1 + h)
+
+def _skewed_quotes_into(m:np.ndarray, inv_skew_px, h_bps:np.ndarray, out_bids:np.ndarray, out_asks:np.ndarray):
+    # _skewed_quotes for arrays, written into out_bids/out_asks; m and h_bps are consumed as scratch
+    r = np.add(m, inv_skew_px, out=m)
+    h = np.multiply(h_bps, _INV_1E4, out=h_bps)
+    np.subtract(1, h, out=out_bids); out_bids *= r
+    np.add(1, h, out=out_asks); out_asks *= r
+
+def _make_quote_kernel(taker_fee_bps:float, ref_size_usd:float, size_exp:float):
+    # specializes the pricing math for a fixed config: the constants live in closure cells,
+    # so per-call work is only the book/inputs. Kernel returns (bid, ask, mid_ref, half_spread_bps).
+    def _quote_kernel(bid_px:float, bid_sz:float, ask_px:float, ask_sz:float, sigma_bps:float,
+                      inv_skew_px:float, size_usd:float)->tuple[float, float, float, float]:
+        m = microprice_px(bid_px, bid_sz, ask_px, ask_sz)
+        h_bps = (taker_fee_bps + _exp_slippage_bps(size_usd, min(bid_sz, ask_sz), (bid_px+ask_px)*0.5)
+                 + _vol_term_bps(max(sigma_bps, 0.0)) + _size_curve_bps(size_usd, ref_size_usd, size_exp))
+        bid, ask = _skewed_quotes(m, inv_skew_px, h_bps)
+        return bid, ask, m, h_bps
+
+    return _quote_kernel
+
 class QuoteEngine:
     def __init__(self, cfg:AppConfig):
         self.cfg = cfg
-
-    def base_halfspread_bps(self, sigma_bps:float, exp_slippage_bps:float)->float:
-        # cover taker fee + expected slippage + a small vol term
-        fee = self.cfg.fees_y.taker_bps
-        vol_term = max(0.0, 0.35 * sigma_bps**0.5)  # light vol sensitivity
-        return fee + exp_slippage_bps + vol_term
+        # config is frozen: snapshot the scalars once, in the units the pricing math uses
+        self._taker_fee_bps = cfg.fees_y.taker_bps
+        self._ref_size_usd = cfg.quote.size_usd
+        self._size_exp = cfg.quote.size_curve_k - 1
+        self._kernel = _make_quote_kernel(self._taker_fee_bps, self._ref_size_usd, self._size_exp)
 
     def size_curve_bps(self, size_usd:float)->float:
-        # convex size premium: k * (size/25k)^(exp-1)
-        k = 1.0
-        exp = self.cfg.quote.size_curve_k
-        return k * max(0.0, (size_usd / self.cfg.quote.size_usd)**(exp-1))  # bps add-on
+        return _size_curve_bps(size_usd, self._ref_size_usd, self._size_exp)  # bps add-on
 
     def compute(self, book_y:BookTop, sigma_bps:float, inv_skew_px:float, size_usd:float)->Quote:
-        m = microprice(book_y)
-        exp_slippage = self._expected_slippage_bps(book_y, size_usd)
-        h_bps = self.base_halfspread_bps(sigma_bps, exp_slippage) + self.size_curve_bps(size_usd)
-        # reservation price shift:
-        r = m + inv_skew_px
-        bid = r * (1 - h_bps/1e4)
-        ask = r * (1 + h_bps/1e4)
-        return Quote(bid=bid, ask=ask, mid_ref=m, half_spread_bps=h_bps)
-
-    def _expected_slippage_bps(self, book:BookTop, size_usd:float)->float:
-        # crude: assume cross top, if not enough depth, pay 1-2 bps extra
-        top_depth_usd = min(book.bid_sz, book.ask_sz) * ((book.bid_px+book.ask_px)/2)
-        return 1.0 if size_usd <= top_depth_usd else 2.0
+        return Quote(*self._kernel(
+            book_y.bid_px, book_y.bid_sz, book_y.ask_px, book_y.ask_sz, sigma_bps, inv_skew_px, size_usd
+        ))
+
+    def compute_into(self, book_y:BookTop, sigma_bps:float, inv_skew_px:float, size_usd:float, out):
+        # allocation-free variant of compute: writes out[0]=bid, out[1]=ask into a reused buffer
+        out[0], out[1], _, _ = self._kernel(
+            book_y.bid_px, book_y.bid_sz, book_y.ask_px, book_y.ask_sz, sigma_bps, inv_skew_px, size_usd
+        )
+        return out
+
+    def compute_batch(self, batch:BookTopBatch, sigma_bps, inv_skew_px, size_usd:float)->tuple[np.ndarray, np.ndarray]:
+        # vectorized compute over all live rows; sigma_bps / inv_skew_px may be scalars or per-row arrays.
+        # Math stays in the batch dtype (float32 batches are not upcast).
+        n = batch.n
+        return self.compute_batch_into(batch, sigma_bps, inv_skew_px, size_usd,
+                                       np.empty(n, dtype=batch.dtype), np.empty(n, dtype=batch.dtype))
+
+    def compute_batch_into(self, batch:BookTopBatch, sigma_bps, inv_skew_px, size_usd:float,
+                           out_bids:np.ndarray, out_asks:np.ndarray)->tuple[np.ndarray, np.ndarray]:
+        # as compute_batch, but writes into the first n rows of caller-owned buffers and returns those views
+        n = batch.n
+        dt = batch.dtype
+        bp, bs, ap, az = batch.bid_px[:n], batch.bid_sz[:n], batch.ask_px[:n], batch.ask_sz[:n]
+        m = microprice_batch(bp, bs, ap, az)
+        # the slippage rule yields exact 1.0/2.0, so narrowing it to the batch dtype is lossless
+        exp_slippage = _exp_slippage_bps(size_usd, np.minimum(bs, az), (bp + ap) * 0.5).astype(dt, copy=False)
+        h_bps = self._taker_fee_bps + exp_slippage  # fresh row array: accumulate the rest in place
+        h_bps += _vol_term_bps(np.maximum(np.asarray(sigma_bps, dtype=dt), 0.0), np.sqrt)
+        h_bps += self.size_curve_bps(size_usd)
+        bids, asks = out_bids[:n], out_asks[:n]
+        _skewed_quotes_into(m, np.asarray(inv_skew_px, dtype=dt), h_bps, bids, asks)
+        return bids, asks
@@ -1,37 +1,64 @@
 import asyncio
 import hmac
 import hashlib
+import ssl
 import time
-import json
 from dataclasses import dataclass
 from typing import Callable, Optional, Dict, Any, Iterable
 from urllib.parse import urlencode
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError, URLError
 
+import aiohttp
+import orjson
 
-@dataclass
-class BookTop:
-    bid_px: float
-    bid_sz: float
-    ask_px: float
-    ask_sz: float
-    ts_ms: int
+from .types import BookTop, Trade, Side, BUY, SELL, side_to_sign
 
+# One TLS context and one connection pool (with its DNS cache) per event loop,
+# shared by every BinanceIntegration instance, e.g. live and testnet clients.
+_SSL_CTX = ssl.create_default_context()
+_SIDE_WIRE = {BUY: "BUY", SELL: "SELL"}
+_shared_connector: Optional[aiohttp.TCPConnector] = None
+_shared_loop: Optional[asyncio.AbstractEventLoop] = None
+_stale_closes: set = set()  # strong refs to in-flight closes of stale pools
+
+
+def _get_shared_connector() -> aiohttp.TCPConnector:
+    global _shared_connector, _shared_loop
+    loop = asyncio.get_running_loop()
+    if _shared_connector is None or _shared_connector.closed or _shared_loop is not loop:
+        if _shared_connector is not None and not _shared_connector.closed:
+            _close_stale_connector(_shared_connector, _shared_loop)
+        _shared_connector = aiohttp.TCPConnector(
+            ssl=_SSL_CTX, limit=32, use_dns_cache=True, ttl_dns_cache=300, keepalive_timeout=60
+        )
+        _shared_loop = loop
+    return _shared_connector
+
+
+def _close_stale_connector(conn: aiohttp.TCPConnector, loop: asyncio.AbstractEventLoop) -> None:
+    # a pool left behind by a previous event loop must be closed without touching that loop from here
+    if loop.is_closed():
+        # its transports died with the loop, so closing is bookkeeping the current loop can finish
+        task = asyncio.get_running_loop().create_task(conn.close())
+        _stale_closes.add(task)
+        task.add_done_callback(_stale_closes.discard)
+    else:
+        asyncio.run_coroutine_threadsafe(conn.close(), loop)
 
-@dataclass
-class Trade:
-    px: float
-    sz: float
-    side: str  # "buy" or "sell" (taker side)
-    ts_ms: int
 
+async def close_shared_connector() -> None:
+    """Closes the shared connection pool; call once on shutdown."""
+    global _shared_connector, _shared_loop
+    if _shared_connector is not None and not _shared_connector.closed:
+        await _shared_connector.close()
+    _shared_connector = None
+    _shared_loop = None
 
-@dataclass
+
+@dataclass(slots=True)
 class Fill:
     px: float
     sz: float
-    side: str  # our perspective; if we sold, side="sell"
+    side: Side  # our perspective; if we sold, side=SELL
     ts_ms: int
     order_id: str
 
@@ -45,16 +72,20 @@ class BinanceAPIError(Exception):
 
 class BinanceIntegration:
     """
-    Lightweight Binance connectivity using only the Python standard library.
+    Lightweight Binance connectivity over a shared aiohttp session.
 
-    - Provides market data (best bid/ask and last trade) via polling.
+    - Provides market data (best bid/ask and last trade) via websocket push,
+      with REST polling kept as a fallback.
     - Transmits orders (MARKET or LIMIT) via signed REST.
     - Receives fills by polling recent trades and de-duplicating.
 
     Notes
-    - Optimized for low overhead and zero third-party deps.
-    - Uses polling (250ms for book/trades; 1s for fills) to avoid websockets.
+    - Keep-alive connection pool shared across instances; requests are native
+      coroutines, so polls pay neither a fresh TCP/TLS handshake nor a thread-pool hop.
+    - Polling fallback runs at 250ms for book/trades; fills are polled at 1s.
     - Testnet is supported via binance.vision endpoints.
+    - Call `load_symbol_filters()` at startup to format orders at exchange precision.
+    - Call `close()` on shutdown, then `close_shared_connector()` once for the pool.
     """
 
     def __init__(
@@ -69,18 +100,35 @@ class BinanceIntegration:
     ) -> None:
         self.api_key = api_key or ""
         self.api_secret = api_secret or ""
+        # keyed HMAC state is derived once; each signature copies it
+        self._hmac_template = (
+            hmac.new(self.api_secret.encode(), digestmod=hashlib.sha256) if self.api_secret else None
+        )
         self.symbol = symbol.upper()
         self.recv_window_ms = recv_window_ms
         self.user_agent = user_agent
+        # per-process constant params of symbol-scoped signed calls, encoded once; only the tail varies
+        self._const_query = urlencode([("symbol", self.symbol), ("recvWindow", self.recv_window_ms)])
+        self._order_const_query = self._const_query + "&newOrderRespType=FULL"
         if testnet:
             self._rest_base = "https://testnet.binance.vision"
+            self._ws_base = "wss://testnet.binance.vision"
         else:
             self._rest_base = "https://api.binance.com"
+            self._ws_base = "wss://stream.binance.com:9443"
+
+        # the session is created lazily inside the running loop
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._timeout = aiohttp.ClientTimeout(total=5)
+
+        # symbol decimals from exchangeInfo; None until load_symbol_filters()
+        self._qty_prec: Optional[int] = None
+        self._px_prec: Optional[int] = None
 
         # last-seen state (to suppress duplicate callbacks)
         self._last_book: Optional[BookTop] = None
         self._last_trade_ts: Optional[int] = None
-        self._seen_trade_ids: set[int] = set()  # for fills polling
+        self._max_trade_id: int = -1  # for fills polling; Binance trade ids are monotonic per symbol
 
     # --------------- Public: Market Data ---------------
     async def market_data_loop(
@@ -99,10 +147,10 @@ class BinanceIntegration:
         poll_s = max(poll_ms, 50) / 1000.0
         while True:
             try:
-                # Fetch book and last trade concurrently using threads.
-                book_task = asyncio.to_thread(self._fetch_book_top, depth_limit)
-                trade_task = asyncio.to_thread(self._fetch_last_trade)
-                book, trade = await asyncio.gather(book_task, trade_task)
+                # Fetch book and last trade concurrently over the pooled session.
+                book, trade = await asyncio.gather(
+                    self._fetch_book_top(depth_limit), self._fetch_last_trade()
+                )
 
                 if book is not None and self._book_changed(book):
                     self._last_book = book
@@ -116,13 +164,69 @@ class BinanceIntegration:
                 await asyncio.sleep(0.5)
             await asyncio.sleep(poll_s)
 
+    async def ws_market_data_loop(
+        self,
+        on_book: Callable[[BookTop], None],
+        on_trade: Callable[[Trade], None],
+        *,
+        reconnect_s: float = 1.0,
+    ) -> None:
+        """Streams top-of-book and trades over one websocket and fires callbacks.
+
+        - Subscribes to the combined <sym>@bookTicker and <sym>@trade streams.
+        - The server only pushes updates, so no change/new-trade filtering is done.
+        - Reconnects after `reconnect_s` whenever the socket drops.
+        """
+        sym = self.symbol.lower()
+        url = f"{self._ws_base}/stream?streams={sym}@bookTicker/{sym}@trade"
+        while True:
+            try:
+                async with self._get_session().ws_connect(url, heartbeat=30) as ws:
+                    async for msg in ws:
+                        if msg.type is not aiohttp.WSMsgType.TEXT:
+                            continue
+                        frame = orjson.loads(msg.data)
+                        stream = frame.get("stream", "")
+                        data = frame.get("data") or {}
+                        if stream.endswith("@bookTicker"):
+                            book = self._parse_book_ticker(data)
+                            self._last_book = book
+                            on_book(book)
+                        elif stream.endswith("@trade"):
+                            trade = self._parse_ws_trade(data)
+                            self._last_trade_ts = trade.ts_ms
+                            on_trade(trade)
+            except Exception:
+                # Swallow errors to keep the stream alive; reconnect below
+                pass
+            await asyncio.sleep(reconnect_s)
+
     def last_book(self) -> Optional[BookTop]:
         return self._last_book
 
+    async def close(self) -> None:
+        """Closes this instance's HTTP session; the shared pool stays open."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
     # --------------- Public: Orders ---------------
-    def place_order(
+    async def load_symbol_filters(self) -> None:
+        """Caches price/quantity decimals for the symbol from exchangeInfo.
+
+        Not called implicitly: the caller must await this once before placing orders,
+        otherwise prices/quantities fall back to compact 8-decimal formatting.
+        """
+        data = await self._public_request("GET", "/api/v3/exchangeInfo", {"symbol": self.symbol})
+        for f in data["symbols"][0].get("filters", []):
+            if f.get("filterType") == "PRICE_FILTER":
+                self._px_prec = self._step_decimals(f["tickSize"])
+            elif f.get("filterType") == "LOT_SIZE":
+                self._qty_prec = self._step_decimals(f["stepSize"])
+
+    async def place_order(
         self,
-        side: str,
+        side: Side | str,
         quantity: float,
         *,
         price: Optional[float] = None,
@@ -132,7 +236,7 @@ class BinanceIntegration:
     ) -> Dict[str, Any]:
         """Places an order via REST and returns the raw exchange response.
 
-        - side: "BUY" or "SELL" (case-insensitive accepted)
+        - side: BUY or SELL; legacy "BUY"/"SELL" strings (case-insensitive) accepted
         - quantity: base-asset quantity
         - price: for LIMIT orders; omit for MARKET
         - order_type: override (default MARKET if no price else LIMIT)
@@ -142,33 +246,32 @@ class BinanceIntegration:
         if not self.api_key or not self.api_secret:
             raise ValueError("API key/secret required to place orders")
 
-        side_u = side.upper()
-        if side_u not in ("BUY", "SELL"):
-            raise ValueError("side must be BUY or SELL")
+        try:
+            side_u = _SIDE_WIRE[side_to_sign(side)]
+        except KeyError:
+            raise ValueError("side must be BUY or SELL") from None
 
         params: Dict[str, Any] = {
-            "symbol": self.symbol,
             "side": side_u,
-            "quantity": self._fmt_num(quantity),
-            "newOrderRespType": "FULL",
+            "quantity": self._fmt_num(quantity, self._qty_prec),
             "timestamp": self._now_ms(),
-            "recvWindow": self.recv_window_ms,
         }
 
         if price is None and (order_type or "").upper() not in ("LIMIT",):
             params["type"] = (order_type or "MARKET").upper()
         else:
             params["type"] = (order_type or "LIMIT").upper()
-            params["price"] = self._fmt_num(price)
+            params["price"] = self._fmt_num(price, self._px_prec)
             params["timeInForce"] = (time_in_force or "IOC").upper()
 
         if client_order_id:
             params["newClientOrderId"] = client_order_id
 
-        return self._signed_request("POST", "/api/v3/order", params)
+        return await self._signed_request("POST", "/api/v3/order", params, const_query=self._order_const_query)
 
     async def async_place_order(self, *args, **kwargs) -> Dict[str, Any]:
-        return await asyncio.to_thread(self.place_order, *args, **kwargs)
+        # kept for callers written against the threaded API
+        return await self.place_order(*args, **kwargs)
 
     # --------------- Public: Fills ---------------
     async def fills_loop(
@@ -183,17 +286,17 @@ class BinanceIntegration:
 
         while True:
             try:
-                trades = await asyncio.to_thread(self._fetch_my_trades)
+                trades = await self._fetch_my_trades()
                 for t in trades:
                     tid = int(t.get("id"))
-                    if tid not in self._seen_trade_ids:
-                        self._seen_trade_ids.add(tid)
+                    if tid > self._max_trade_id:
+                        self._max_trade_id = tid
                         fill = Fill(
-                            px=float(t["price"]),
-                            sz=float(t["qty"]),
-                            side=("buy" if t.get("isBuyer") else "sell"),
-                            ts_ms=int(t.get("time", self._now_ms())),
-                            order_id=str(t.get("orderId", "")),
+                            float(t["price"]),
+                            float(t["qty"]),
+                            BUY if t.get("isBuyer") else SELL,
+                            int(t.get("time", self._now_ms())),
+                            str(t.get("orderId", "")),
                         )
                         on_fill(fill)
             except Exception:
@@ -201,22 +304,22 @@ class BinanceIntegration:
             await asyncio.sleep(max(0.05, poll_interval_s))
 
     # --------------- Internal: Market Data fetchers ---------------
-    def _fetch_book_top(self, depth_limit: int) -> Optional[BookTop]:
+    async def _fetch_book_top(self, depth_limit: int) -> Optional[BookTop]:
         path = "/api/v3/depth"
         params = {"symbol": self.symbol, "limit": max(5, int(depth_limit))}
-        data = self._public_request("GET", path, params)
+        data = await self._public_request("GET", path, params)
         bids: Iterable[list] = data.get("bids", [])
         asks: Iterable[list] = data.get("asks", [])
         if not bids or not asks:
             return None
         bid_px, bid_sz = float(bids[0][0]), float(bids[0][1])
         ask_px, ask_sz = float(asks[0][0]), float(asks[0][1])
-        return BookTop(bid_px=bid_px, bid_sz=bid_sz, ask_px=ask_px, ask_sz=ask_sz, ts_ms=self._now_ms())
+        return BookTop(bid_px, bid_sz, ask_px, ask_sz, self._now_ms())
 
-    def _fetch_last_trade(self) -> Optional[Trade]:
+    async def _fetch_last_trade(self) -> Optional[Trade]:
         path = "/api/v3/trades"
         params = {"symbol": self.symbol, "limit": 1}
-        arr = self._public_request("GET", path, params)
+        arr = await self._public_request("GET", path, params)
         if not isinstance(arr, list) or not arr:
             return None
         t = arr[-1]
@@ -224,19 +327,28 @@ class BinanceIntegration:
         sz = float(t["qty"])    # qty as string
         is_buyer_maker = bool(t.get("isBuyerMaker", False))
         # trade stream returns taker side; here isBuyerMaker True => buyer was maker => taker was sell
-        side = "sell" if is_buyer_maker else "buy"
+        side = SELL if is_buyer_maker else BUY
         ts_ms = int(t.get("time", self._now_ms()))
-        return Trade(px=px, sz=sz, side=side, ts_ms=ts_ms)
+        return Trade(px, sz, side, ts_ms)
+
+    def _parse_book_ticker(self, d: Dict[str, Any]) -> BookTop:
+        # bookTicker frames carry no event time; stamp on receipt
+        return BookTop(float(d["b"]), float(d["B"]), float(d["a"]), float(d["A"]), self._now_ms())
+
+    def _parse_ws_trade(self, d: Dict[str, Any]) -> Trade:
+        # "m" is buyer-is-maker, so True => taker was sell
+        side = SELL if d.get("m") else BUY
+        return Trade(float(d["p"]), float(d["q"]), side, int(d.get("T", self._now_ms())))
 
     # --------------- Internal: Private fetchers ---------------
-    def _fetch_my_trades(self) -> list[Dict[str, Any]]:
+    async def _fetch_my_trades(self) -> list[Dict[str, Any]]:
         path = "/api/v3/myTrades"
-        params = {"symbol": self.symbol, "timestamp": self._now_ms(), "recvWindow": self.recv_window_ms, "limit": 100}
-        data = self._signed_request("GET", path, params)
+        params = {"timestamp": self._now_ms(), "limit": 100}
+        data = await self._signed_request("GET", path, params, const_query=self._const_query)
         return data if isinstance(data, list) else []
 
     # --------------- Internal: HTTP helpers ---------------
-    def _public_request(self, method: str, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+    async def _public_request(self, method: str, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
         url = self._rest_base + path
         q = urlencode(params or {})
         if method == "GET" and q:
@@ -244,20 +356,24 @@ class BinanceIntegration:
             body = None
         else:
             body = q.encode() if q else None
-        return self._do_request(method, url, body=body, signed=False)
+        return await self._do_request(method, url, body=body, signed=False)
 
-    def _signed_request(self, method: str, path: str, params: Dict[str, Any]) -> Any:
+    async def _signed_request(
+        self, method: str, path: str, params: Dict[str, Any], *, const_query: Optional[str] = None
+    ) -> Any:
+        # const_query is an opt-in pre-encoded prefix (e.g. symbol & recvWindow) for endpoints that
+        # take it; params carry only the varying part
         if not self.api_secret:
             raise ValueError("API secret required for signed requests")
-        # ensure timestamp & recvWindow exist
-        p = dict(params)
-        if "timestamp" not in p:
-            p["timestamp"] = self._now_ms()
-        if "recvWindow" not in p:
-            p["recvWindow"] = self.recv_window_ms
+        prefix = const_query or ""
+        p = params if "timestamp" in params else {**params, "timestamp": self._now_ms()}
 
-        query = urlencode({k: p[k] for k in sorted(p.keys()) if p[k] is not None})
-        sig = hmac.new(self.api_secret.encode(), query.encode(), hashlib.sha256).hexdigest()
+        # Binance signs the exact query sent; key order need not be sorted
+        tail = urlencode([(k, v) for k, v in p.items() if v is not None])
+        query = prefix + "&" + tail if prefix and tail else prefix or tail
+        h = self._hmac_template.copy()
+        h.update(query.encode())
+        sig = h.hexdigest()
 
         url = self._rest_base + path
         if method == "GET":
@@ -265,45 +381,57 @@ class BinanceIntegration:
             body = None
         else:
             body = (query + "&signature=" + sig).encode()
-        return self._do_request(method, url, body=body, signed=True)
+        return await self._do_request(method, url, body=body, signed=True)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(connector=_get_shared_connector(), connector_owner=False)
+        return self._session
 
-    def _do_request(self, method: str, url: str, *, body: Optional[bytes], signed: bool) -> Any:
+    async def _do_request(self, method: str, url: str, *, body: Optional[bytes], signed: bool) -> Any:
         headers = {
             "User-Agent": self.user_agent,
             "Content-Type": "application/x-www-form-urlencoded",
         }
         if signed and self.api_key:
             headers["X-MBX-APIKEY"] = self.api_key
-        req = Request(url=url, method=method.upper(), data=body, headers=headers)
+        session = self._get_session()
         try:
-            with urlopen(req, timeout=5) as resp:
-                raw = resp.read()
+            async with session.request(
+                method.upper(), url, data=body, headers=headers, timeout=self._timeout
+            ) as resp:
+                raw = await resp.read()
+                if resp.status >= 400:
+                    raise BinanceAPIError(resp.status, raw.decode(errors="replace"))
                 if not raw:
                     return None
                 try:
-                    return json.loads(raw.decode())
-                except json.JSONDecodeError:
+                    return orjson.loads(raw)
+                except orjson.JSONDecodeError:
                     return raw.decode()
-        except HTTPError as e:
-            try:
-                payload = e.read().decode()
-            except Exception:
-                payload = str(e)
-            raise BinanceAPIError(e.code, payload) from None
-        except URLError as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             raise ConnectionError(f"Network error: {e}") from None
 
     # --------------- Internal: utils ---------------
     @staticmethod
-    def _fmt_num(x: Optional[float]) -> Optional[str]:
+    def _fmt_num(x: Optional[float], prec: Optional[int] = None) -> Optional[str]:
         if x is None:
             return None
-        # Binance accepts up to symbol-specific precision; format compactly
-        return ("%f" % x).rstrip("0").rstrip(".")
+        if prec is not None:
+            # symbol precision known: fixed decimals, nothing to strip
+            return f"{x:.{prec}f}"
+        # Binance accepts at most 8 decimals; format compactly
+        return format(x, ".8f").rstrip("0").rstrip(".")
+
+    @staticmethod
+    def _step_decimals(step: str) -> int:
+        # "0.00100000" -> 3, "1.00000000" -> 0
+        frac = step.rstrip("0").partition(".")[2]
+        return len(frac)
 
     @staticmethod
     def _now_ms() -> int:
-        return int(time.time() * 1000)
+        return time.time_ns() // 1_000_000
 
     def _book_changed(self, b: BookTop) -> bool:
         lb = self._last_book
@@ -1,26 +1,31 @@
-import asyncio
-from typing import AsyncIterator, Callable
+from typing import Callable
 from .types import BookTop, Trade
+from .binanceintegration import BinanceIntegration
 
 class MarketDataY:
-    def __init__(self, symbol:str):
+    def __init__(self, symbol:str, feed:BinanceIntegration|None=None, use_ws:bool=True):
         self.symbol = symbol
+        self.feed = feed or BinanceIntegration(None, None, symbol)
+        self.use_ws = use_ws  # False falls back to REST polling
         self._book: BookTop|None = None
         self._last_trade: Trade|None = None
 
     async def run(self, on_book:Callable[[BookTop],None], on_trade:Callable[[Trade],None]):
-        
-        # Pseudocode: connect websocket, subscribe to trades + book
-        # await ws.send(subscribe_msg)
-        while True:
-            msg = await self._recv()  # parse incoming
-            if msg["type"]=="book_top":
-                self._book = BookTop(**msg["data"])
-                on_book(self._book)
-            elif msg["type"]=="trade":
-                self._last_trade = Trade(**msg["data"])
-                on_trade(self._last_trade)
+        def _on_book(book:BookTop):
+            self._book = book
+            on_book(book)
+
+        def _on_trade(trade:Trade):
+            self._last_trade = trade
+            on_trade(trade)
+
+        if self.use_ws:
+            await self.feed.ws_market_data_loop(_on_book, _on_trade)
+        else:
+            await self.feed.market_data_loop(_on_book, _on_trade)
+
+    async def close(self):
+        await self.feed.close()
 
-    async def _recv(self): ...
     def last_book(self)->BookTop|None: return self._book
     def last_trade(self)->Trade|None: return self._last_trade
@@ -1,9 +1,24 @@
 from dataclasses import dataclass
-from typing import Literal
+from typing import NamedTuple, Sequence
+import numpy as np
 
-Side = Literal["buy", "sell"]
+# Sides are signed ints so position/PnL math is a multiply, not a string compare.
+BUY, SELL = 1, -1
+Side = int
 
-@dataclass
+_LEGACY_SIDES = {"buy": BUY, "sell": SELL}
+
+def side_to_sign(side:Side|str)->Side:
+    # accepts legacy "buy"/"sell" strings for one release
+    return _LEGACY_SIDES[side.lower()] if isinstance(side, str) else side
+
+# Market/fill records are immutable snapshots with no per-instance __dict__ (slotted frozen
+# dataclasses, FillOnX a NamedTuple), hashable so they can key caches. Ingest paths construct them
+# positionally (no kwargs dict per message), so field order is part of the interface.
+# Fields are validated at wire decode and trusted thereafter: constructors do no checks,
+# use FillOnX.checked() for untrusted/external input.
+
+@dataclass(slots=True, frozen=True)
 class BookTop:
     bid_px: float
     bid_sz: float
@@ -11,17 +26,125 @@ class BookTop:
     ask_sz: float
     ts_ms: int
 
-@dataclass
+# Packed numpy record layouts mirroring the dataclasses, for bulk storage and zero-copy hand-off.
+BOOKTOP_DT = np.dtype([("bid_px", "f8"), ("bid_sz", "f8"), ("ask_px", "f8"), ("ask_sz", "f8"), ("ts_ms", "i8")])
+
+@dataclass(slots=True)
+class BookTopBatch:
+    # structure-of-arrays BookTops for batched pricing; the first n rows of each column are live.
+    # Price/size columns default to float64; float32 halves memory traffic for per-tick pricing
+    # (keep anything that accumulates across fills, e.g. PnL, in float64).
+    bid_px: np.ndarray
+    bid_sz: np.ndarray
+    ask_px: np.ndarray
+    ask_sz: np.ndarray
+    ts_ms: np.ndarray
+    n: int = 0
+
+    @classmethod
+    def empty(cls, capacity:int=1024, dtype=np.float64)->"BookTopBatch":
+        px = lambda: np.empty(capacity, dtype=dtype)
+        return cls(px(), px(), px(), px(), np.empty(capacity, dtype=np.int64))
+
+    @classmethod
+    def from_records(cls, books:Sequence[BookTop], dtype=np.float64)->"BookTopBatch":
+        n = len(books)
+        col = lambda f, dt: np.fromiter((getattr(b, f) for b in books), dtype=dt, count=n)
+        return cls(col("bid_px", dtype), col("bid_sz", dtype), col("ask_px", dtype),
+                   col("ask_sz", dtype), col("ts_ms", np.int64), n=n)
+
+    @classmethod
+    def from_array(cls, recs:np.ndarray, dtype=np.float64)->"BookTopBatch":
+        # BOOKTOP_DT records -> contiguous columns
+        cols = [np.ascontiguousarray(recs[f], dtype=dtype) for f in ("bid_px", "bid_sz", "ask_px", "ask_sz")]
+        return cls(*cols, np.ascontiguousarray(recs["ts_ms"]), n=len(recs))
+
+    def append(self, b:BookTop):
+        i = self.n
+        if i == len(self.ts_ms):
+            self._grow()
+        self.bid_px[i] = b.bid_px; self.bid_sz[i] = b.bid_sz
+        self.ask_px[i] = b.ask_px; self.ask_sz[i] = b.ask_sz
+        self.ts_ms[i] = b.ts_ms
+        self.n = i + 1
+
+    def _grow(self):
+        # double on full, copying only the live rows
+        cap = max(16, 2*len(self.ts_ms))
+        for name in ("bid_px", "bid_sz", "ask_px", "ask_sz", "ts_ms"):
+            old = getattr(self, name)
+            new = np.empty(cap, dtype=old.dtype)
+            new[:self.n] = old[:self.n]
+            setattr(self, name, new)
+
+    @property
+    def dtype(self)->np.dtype:
+        return self.bid_px.dtype
+
+    def __len__(self)->int:
+        return self.n
+
+@dataclass(slots=True, frozen=True)
 class Trade:
     px: float
     sz: float
     side: Side  # taker side on Y
     ts_ms: int
 
-@dataclass
-class FillOnX:
+TRADE_DT = np.dtype([("px", "f8"), ("sz", "f8"), ("side", "i1"), ("ts_ms", "i8")])
+
+class OrderIdTable:
+    # interns venue order-id strings to dense int handles: one hash lookup on ingest,
+    # int compares everywhere after
+    __slots__ = ("_s2i", "_i2s")
+
+    def __init__(self):
+        self._s2i: dict[str, int] = {}
+        self._i2s: list[str] = []
+
+    def intern(self, oid:str)->int:
+        i = self._s2i.get(oid)
+        if i is None:
+            i = len(self._i2s)
+            self._s2i[oid] = i
+            self._i2s.append(oid)
+        return i
+
+    def resolve(self, i:int)->str:
+        return self._i2s[i]
+
+class FillOnX(NamedTuple):
+    # a tuple, so fill dedup (==, hash, set membership) runs as C tuple compares
     px: float
     sz: float
-    side: Side  # our perspective on X: if we were lifted, side="sell"
+    side: Side  # our perspective on X: if we were lifted, side=SELL
     ts_ms: int
-    order_id: str
+    order_id: int  # handle from OrderIdTable
+
+    @classmethod
+    def new(cls, px:float, sz:float, side:Side, ts_ms:int, oid:str, table:OrderIdTable)->"FillOnX":
+        return cls(px, sz, side, ts_ms, table.intern(oid))
+
+    @classmethod
+    def checked(cls, px:float, sz:float, side:Side, ts_ms:int, order_id:int)->"FillOnX":
+        if not px > 0:
+            raise ValueError(f"fill px must be > 0, got {px}")
+        if not sz > 0:
+            raise ValueError(f"fill sz must be > 0, got {sz}")
+        if side not in (BUY, SELL):
+            raise ValueError(f"fill side must be BUY or SELL, got {side!r}")
+        return cls(px, sz, side, ts_ms, order_id)
+
+FILL_DT = np.dtype([("px", "f8"), ("sz", "f8"), ("side", "i1"), ("ts_ms", "i8"), ("order_id", "i4")])
+
+_RECORD_DTYPES = {BookTop: BOOKTOP_DT, Trade: TRADE_DT, FillOnX: FILL_DT}
+
+def booktop_array(n:int)->np.ndarray:
+    return np.zeros(n, dtype=BOOKTOP_DT)
+
+def as_record(obj:BookTop|Trade|FillOnX)->np.void:
+    dt = _RECORD_DTYPES[type(obj)]
+    return np.array(tuple(getattr(obj, f) for f in dt.names), dtype=dt)[()]
+
+def from_record(rec:np.void, cls:type):
+    return cls(*rec.item())
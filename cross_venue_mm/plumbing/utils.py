@@ -1,14 +1,16 @@
 import asyncio
 import logging
+import time
 from datetime import datetime, timezone
 from statistics import mean
 from typing import Iterable, Optional
+import numpy as np
 
 # ---------- Time Utilities ----------
 
 def utc_now_ms() -> int:
     """Return current UTC timestamp in milliseconds."""
-    return int(datetime.now(timezone.utc).timestamp() * 1000)
+    return time.time_ns() // 1_000_000
 
 def fmt_ts(ms: int) -> str:
     """Format a millisecond timestamp to ISO 8601 string."""
@@ -33,31 +35,73 @@ def safe_mean(values: Iterable[float]) -> Optional[float]:
 
 class AsyncRateLimiter:
     """
-    Simple async rate limiter using a semaphore and sleep delay.
+    Token-bucket async rate limiter; refills continuously at max_calls/per_seconds.
     Example:
         limiter = AsyncRateLimiter(5, 1.0)  # max 5 ops per second
         async with limiter:
             await do_something()
     """
     def __init__(self, max_calls: int, per_seconds: float):
-        self._sem = asyncio.Semaphore(max_calls)
         self._max_calls = max_calls
         self._per_seconds = per_seconds
-        asyncio.create_task(self._reset_loop())
+        self._rate = max_calls / per_seconds  # tokens per second
+        self._tokens = float(max_calls)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()  # waiters queue up in arrival order
 
-    async def _reset_loop(self):
-        while True:
-            await asyncio.sleep(self._per_seconds)
-            for _ in range(self._max_calls - self._sem._value):
-                self._sem.release()
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self._max_calls, self._tokens + (now - self._last_refill) * self._rate)
+        self._last_refill = now
 
     async def __aenter__(self):
-        await self._sem.acquire()
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+                self._refill()
+            self._tokens -= 1
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
         pass
 
+# ---------- Containers ----------
+
+class RingBuffer:
+    """
+    Fixed-capacity ring of numpy records (e.g. FILL_DT): O(1) push, no per-element allocation.
+    Example:
+        fills = RingBuffer(4096, FILL_DT)
+        fills.push((px, sz, side, ts_ms, order_id))
+        last = fills.recent(100)  # oldest -> newest
+    """
+    __slots__ = ("buf", "n", "cap")
+
+    def __init__(self, cap: int, dtype):
+        self.buf = np.empty(cap, dtype=dtype)
+        self.n = 0  # total pushes; write slot is n % cap
+        self.cap = cap
+
+    def push(self, rec):
+        self.buf[self.n % self.cap] = rec
+        self.n += 1
+
+    def recent(self, k: Optional[int] = None) -> np.ndarray:
+        """Last k records in push order; a view unless the slice wraps."""
+        size = min(self.n, self.cap)
+        k = size if k is None else min(k, size)
+        end = self.n % self.cap
+        if end == 0 and self.n:
+            end = self.cap
+        start = end - k
+        if start >= 0:
+            return self.buf[start:end]
+        return np.concatenate((self.buf[start:], self.buf[:end]))
+
+    def __len__(self) -> int:
+        return min(self.n, self.cap)
+
 # ---------- Logging Setup ----------
 
 def setup_logger(name: str = "cross_venue_mm", level=logging.INFO) -> logging.Logger:
@@ -1,4 +1,6 @@
 from .config import AppConfig
+from .types import FILL_DT
+from .utils import RingBuffer
 from .marketdata_y import MarketDataY
 from ..model.indicators import RollingVWAP, RollingVol, microprice
 from ..model.inventory import InventoryState, InventorySkew
@@ -14,8 +16,9 @@ class App:
         self.vwap = RollingVWAP(200)
         self.rvol = RollingVol(cfg.quote.vol_window_secs)
         self.inv = InventoryState()
+        self.fills_x = RingBuffer(4096, FILL_DT)  # recent X fills, feeds compute_pnl_batch
         self.skew = InventorySkew(cfg.inv.gamma, cfg.inv.horizon_secs)
         self.qe = QuoteEngine(cfg)
-        self.maker_x = VenueXMaker(cfg.symbol, cfg.risk.max_order_rate_per_s)
+        self.maker_x = VenueXMaker(cfg.symbol, cfg.risk.max_order_rate_per_s, cfg.quote.epsilon_move_bps)
         self.exec_y = ExecutionY(cfg)
         self.hedger = Hedger(cfg, self.exec_y)
\ No newline at end of file
@@ -1,22 +1,50 @@
-from dataclasses import dataclass
-from .plumbing.types import FillOnX
-from execution_y import ExecReport
+from typing import NamedTuple
+import numpy as np
+from .plumbing.types import FillOnX, side_to_sign
+from .execution_y import ExecReport
 
-@dataclass
-class TradePnL:
+class TradePnL(NamedTuple):
     gross_usd: float
     fees_usd: float
     net_usd: float
 
+# per-report PnL terms, shared by compute_pnl and compute_pnl_batch: plain arithmetic,
+# so they take Python floats or numpy arrays alike
+
+def _gross_usd(sign, px_x, avg_px, filled):
+    # side = +1 (bought on X) / -1 (sold on X): edge is side * (avg_px - px_x) * filled
+    return sign * (avg_px - px_x) * filled
+
+def _fees_usd(fee_bps, avg_px, filled):
+    return fee_bps * 1e-4 * avg_px * filled
+
 def compute_pnl(fill_x:FillOnX, hedge_reports:list[ExecReport])->TradePnL:
     # our perspective: if we sold on X at px_x and bought on Y at avg_px (plus fee), edge = (px_x - avg_px)*qty
-    qty = fill_x.sz
+    sign = side_to_sign(fill_x.side)
     px_x = fill_x.px
     gross = 0.0; fees = 0.0
     for r in hedge_reports:
-        if fill_x.side == "sell":  # we sold on X, bought on Y
-            gross += (px_x - r.avg_px) * (r.filled/qty) * qty
-        else:                      # we bought on X, sold on Y
-            gross += (r.avg_px - px_x) * (r.filled/qty) * qty
-        fees += (r.fee_bps/1e4) * r.avg_px * r.filled
-    return TradePnL(gross_usd=gross, fees_usd=fees, net_usd=gross-fees)
+        avg_px = r.avg_px; filled = r.filled  # each attribute loaded once
+        gross += _gross_usd(sign, px_x, avg_px, filled)
+        fees += _fees_usd(r.fee_bps, avg_px, filled)
+    return TradePnL(gross, fees, gross-fees)
+
+def compute_pnl_batch(fill_px:np.ndarray, fill_side:np.ndarray, rep_avg_px:np.ndarray, rep_filled:np.ndarray,
+                      rep_fee_bps:np.ndarray, rep_offsets:np.ndarray|None=None
+                      )->tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # vectorized compute_pnl for backtests/end-of-day; returns per-fill (gross, fees, net) arrays.
+    # Reports are concatenated fill by fill and rep_offsets[i] is the first report row of fill i;
+    # without offsets, report row i hedges fill i.
+    if rep_offsets is None:
+        px, sign = fill_px, fill_side
+    else:
+        counts = np.diff(np.append(rep_offsets, len(rep_avg_px)))
+        owner = np.repeat(np.arange(len(fill_px)), counts)  # fill index of each report row
+        px, sign = fill_px[owner], fill_side[owner]
+    gross = _gross_usd(sign, px, rep_avg_px, rep_filled)
+    fees = _fees_usd(rep_fee_bps, rep_avg_px, rep_filled)
+    if rep_offsets is not None:
+        # bincount rather than add.reduceat so fills with no reports sum to 0
+        gross = np.bincount(owner, weights=gross, minlength=len(fill_px))
+        fees = np.bincount(owner, weights=fees, minlength=len(fill_px))
+    return gross, fees, gross - fees
@@ -1,23 +1,66 @@
 import asyncio
-from .plumbing.types import Side
+from .plumbing.types import Side, BUY, SELL
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class LiveQuoteIDs:
     bid_order_id: str|None = None
     ask_order_id: str|None = None
 
 class VenueXMaker:
-    def __init__(self, symbol:str, max_rate_per_s:float):
+    def __init__(self, symbol:str, max_rate_per_s:float, epsilon_move_bps:float=0.0):
         self.symbol = symbol
         self.tokens = asyncio.Semaphore(int(max_rate_per_s))  # basic rate control
         self.live = LiveQuoteIDs()
+        self.epsilon_move_bps = epsilon_move_bps
+        # last quotes actually sent, for the epsilon-move gate
+        self._last_bid: float|None = None
+        self._last_ask: float|None = None
+        self._last_size: float|None = None
 
     async def upsert_quotes(self, bid:float, ask:float, size:float):
+        if self._within_epsilon(bid, ask, size):
+            return  # resting quotes are still good enough; skip the REST round-trip
         async with self.tokens:
-            # cancel & replace pattern; venue-specific
-            self.live.bid_order_id = await self._post_or_replace("buy", bid, size)
-            self.live.ask_order_id = await self._post_or_replace("sell", ask, size)
+            # cancel & replace both sides, sent concurrently rather than back to back
+            try:
+                await self._replace_both(bid, ask, size)
+            except BaseException:
+                self._forget_last_sent()  # resting state unknown; requote on the next tick
+                raise
+        self._last_bid, self._last_ask, self._last_size = bid, ask, size
+
+    def on_fill(self, side:Side):
+        # the filled side is no longer resting, so the epsilon gate must not hold it off the book
+        if side == BUY:
+            self._last_bid = None
+        else:
+            self._last_ask = None
+
+    def _forget_last_sent(self):
+        self._last_bid = self._last_ask = self._last_size = None
+
+    def _within_epsilon(self, bid:float, ask:float, size:float)->bool:
+        if not self._last_bid or not self._last_ask or not self._last_size:
+            return False
+        eps = self.epsilon_move_bps
+        # size is quoted as usd/mid, so it drifts with price and is gated the same way
+        return (abs(bid/self._last_bid - 1)*1e4 < eps and abs(ask/self._last_ask - 1)*1e4 < eps
+                and abs(size/self._last_size - 1)*1e4 < eps)
+
+    async def _replace_both(self, bid:float, ask:float, size:float):
+        bid_id, ask_id = await asyncio.gather(
+            self._post_or_replace(BUY, bid, size), self._post_or_replace(SELL, ask, size),
+            return_exceptions=True,
+        )
+        # record whichever leg was placed before surfacing a failure, so cancel_all can still find it
+        if not isinstance(bid_id, BaseException):
+            self.live.bid_order_id = bid_id
+        if not isinstance(ask_id, BaseException):
+            self.live.ask_order_id = ask_id
+        for r in (bid_id, ask_id):
+            if isinstance(r, BaseException):
+                raise r
 
     async def _post_or_replace(self, side:Side, px:float, qty:float)->str:
         # TODO: implement venue X REST/WS order API
@@ -25,4 +68,5 @@ class VenueXMaker:
 
     async def cancel_all(self):
         # cancel live orders
+        self._forget_last_sent()
         ...
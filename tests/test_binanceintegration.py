@@ -0,0 +1,182 @@
+import asyncio
+import hashlib
+import hmac
+import json
+from urllib.parse import parse_qsl
+import pytest
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from cross_venue_mm.plumbing import binanceintegration as bic
+from cross_venue_mm.plumbing.binanceintegration import BinanceIntegration, BinanceAPIError, close_shared_connector
+from cross_venue_mm.plumbing.marketdata_y import MarketDataY
+from cross_venue_mm.plumbing.types import BUY, SELL, Trade
+class _Recorder(BinanceIntegration):
+    # captures the wire request instead of sending it
+    async def _do_request(self, method, url, *, body, signed):
+        self.sent = (method, url, body)
+        return {}
+
+def _client():
+    return _Recorder("key", "secret", "SUIUSDT")
+
+def test_place_order_accepts_side_ints_and_legacy_strings():
+    bi = _client()
+    for side, wire in ((BUY, "BUY"), (SELL, "SELL"), ("sell", "SELL")):
+        asyncio.run(bi.place_order(side, 1.5))
+        assert dict(parse_qsl(bi.sent[2].decode()))["side"] == wire
+    with pytest.raises(ValueError):
+        asyncio.run(bi.place_order("hold", 1.5))
+
+def _signed_query(sent):
+    method, url, body = sent
+    raw = url.partition("?")[2] if method == "GET" else body.decode()
+    query, _, sig = raw.rpartition("&signature=")
+    return query, sig
+
+def test_signature_covers_exact_query_in_order():
+    bi = _client()
+    asyncio.run(bi.place_order(BUY, 1.5, price=0.9876))
+    query, sig = _signed_query(bi.sent)
+    assert sig == hmac.new(b"secret", query.encode(), hashlib.sha256).hexdigest()
+    assert [k for k, _ in parse_qsl(query)] == [
+        "symbol", "recvWindow", "newOrderRespType", "side", "quantity", "timestamp", "type", "price", "timeInForce"]
+
+def test_signed_prefix_is_opt_in():
+    bi = _client()
+    asyncio.run(bi._signed_request("GET", "/api/v3/account", {"timestamp": 1}))
+    query, sig = _signed_query(bi.sent)
+    assert query == "timestamp=1"
+    assert sig == hmac.new(b"secret", b"timestamp=1", hashlib.sha256).hexdigest()
+    asyncio.run(bi._fetch_my_trades())
+    query, _ = _signed_query(bi.sent)
+    assert [k for k, _ in parse_qsl(query)][:2] == ["symbol", "recvWindow"]
+
+def test_step_decimals_from_filter_strings():
+    assert BinanceIntegration._step_decimals("0.00010000") == 4
+    assert BinanceIntegration._step_decimals("1.00000000") == 0
+    assert BinanceIntegration._step_decimals("10.00000000") == 0
+
+def test_fmt_num_fixed_and_compact():
+    assert BinanceIntegration._fmt_num(0.98765432, 4) == "0.9877"
+    assert BinanceIntegration._fmt_num(12.0, 0) == "12"
+    assert BinanceIntegration._fmt_num(1.5) == "1.5"
+    assert BinanceIntegration._fmt_num(2.0) == "2"
+    assert BinanceIntegration._fmt_num(None, 4) is None
+
+def test_load_symbol_filters_sets_order_precision():
+    class _Info(_Recorder):
+        async def _do_request(self, method, url, *, body, signed):
+            if "exchangeInfo" in url:
+                return {"symbols": [{"filters": [{"filterType": "PRICE_FILTER", "tickSize": "0.00010000"},
+                                                 {"filterType": "LOT_SIZE", "stepSize": "1.00000000"}]}]}
+            return await super()._do_request(method, url, body=body, signed=signed)
+    bi = _Info("key", "secret", "SUIUSDT")
+    asyncio.run(bi.load_symbol_filters())
+    asyncio.run(bi.place_order(SELL, 12.0, price=0.98765))
+    sent = dict(parse_qsl(bi.sent[2].decode()))
+    assert sent["quantity"] == "12" and sent["price"] == "0.9877"
+
+def test_parse_book_ticker_and_ws_trade():
+    bi = BinanceIntegration(None, None, "SUIUSDT")
+    book = bi._parse_book_ticker({"u": 1, "s": "SUIUSDT", "b": "0.9876", "B": "1500", "a": "0.9881", "A": "20.5"})
+    assert (book.bid_px, book.bid_sz, book.ask_px, book.ask_sz) == (0.9876, 1500.0, 0.9881, 20.5)
+    assert book.ts_ms > 0  # stamped on receipt
+    trade = bi._parse_ws_trade({"p": "0.9879", "q": "12", "T": 1_700_000_000_456, "m": True})
+    assert trade == Trade(0.9879, 12.0, SELL, 1_700_000_000_456)
+    assert bi._parse_ws_trade({"p": "1", "q": "1", "T": 5, "m": False}).side == BUY
+
+def test_ws_loop_dispatches_by_stream_suffix():
+    frames = [
+        {"stream": "suiusdt@bookTicker", "data": {"b": "0.9876", "B": "1500", "a": "0.9881", "A": "20.5"}},
+        {"stream": "suiusdt@trade", "data": {"p": "0.9879", "q": "12", "T": 7, "m": True}},
+    ]
+    async def ws_handler(request):
+        assert request.query["streams"] == "suiusdt@bookTicker/suiusdt@trade"
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        for f in frames:
+            await ws.send_bytes(b"ignored")  # non-text frames are skipped
+            await ws.send_str(json.dumps(f))
+        await ws.close()
+        return ws
+
+    async def run():
+        app = web.Application()
+        app.router.add_get("/stream", ws_handler)
+        async with TestServer(app) as server:
+            md = MarketDataY("SUIUSDT")
+            md.feed._ws_base = f"ws://{server.host}:{server.port}"
+            books, trades = [], []
+            task = asyncio.create_task(md.run(on_book=books.append, on_trade=trades.append))
+            try:
+                for _ in range(200):
+                    if books and trades:
+                        break
+                    await asyncio.sleep(0.01)
+            finally:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+                await md.close()
+                await close_shared_connector()
+        assert md.feed._session is None
+        return md, books, trades
+    md, books, trades = asyncio.run(run())
+    assert (books[0].bid_px, books[0].ask_sz) == (0.9876, 20.5) and md.last_book() == books[0]
+    assert trades[0] == Trade(0.9879, 12.0, SELL, 7) and md.last_trade() == trades[0]
+
+def test_do_request_maps_status_body_and_network_errors():
+    async def ok(request):
+        return web.json_response({"x": 1})
+    async def text(request):
+        return web.Response(text="pong")
+    async def empty(request):
+        return web.Response(status=204)
+    async def rejected(request):
+        return web.Response(status=400, text='{"code":-1013,"msg":"Filter failure"}')
+    async def slow(request):
+        await asyncio.sleep(1)
+        return web.Response(text="late")
+
+    async def run():
+        app = web.Application()
+        for path, h in (("/ok", ok), ("/text", text), ("/empty", empty), ("/rejected", rejected), ("/slow", slow)):
+            app.router.add_get(path, h)
+        bi = BinanceIntegration(None, None, "SUIUSDT")
+        bi._timeout = aiohttp.ClientTimeout(total=0.2)
+        try:
+            async with TestServer(app) as server:
+                base = f"http://{server.host}:{server.port}"
+                get = lambda path: bi._do_request("GET", base + path, body=None, signed=False)
+                assert await get("/ok") == {"x": 1}
+                assert await get("/text") == "pong"  # non-JSON body falls back to text
+                assert await get("/empty") is None
+                with pytest.raises(BinanceAPIError) as ei:
+                    await get("/rejected")
+                assert ei.value.status == 400 and "-1013" in ei.value.payload
+                with pytest.raises(ConnectionError):
+                    await get("/slow")  # timeout
+            with pytest.raises(ConnectionError):
+                await get("/ok")  # server gone: aiohttp.ClientError
+        finally:
+            await bi.close()
+            await close_shared_connector()
+    asyncio.run(run())
+
+def test_shared_connector_is_per_loop_and_closes_stale_pool():
+    async def grab():
+        conn = bic._get_shared_connector()
+        assert bic._get_shared_connector() is conn  # one pool per loop
+        for _ in range(3):
+            await asyncio.sleep(0)  # let a scheduled stale-pool close finish
+        return conn
+    first = asyncio.run(grab())
+    second = asyncio.run(grab())
+    assert second is not first
+    assert first.closed and not second.closed and not bic._stale_closes
+
+    async def shutdown():
+        await close_shared_connector()
+    asyncio.run(shutdown())
+    assert second.closed
+    assert bic._shared_connector is None and bic._shared_loop is None
@@ -0,0 +1,20 @@
+import asyncio
+import pytest
+from cross_venue_mm.plumbing.config import AppConfig
+from cross_venue_mm.plumbing.types import SELL, BUY
+from cross_venue_mm.execution_y import ExecutionY
+from cross_venue_mm.hedger import Hedger, HedgeLegError
+class _TakerDown(ExecutionY):
+    async def ioc_cross(self, side, qty, ref_px, max_slippage_bps):
+        raise ConnectionError("taker leg rejected")
+def test_hedge_returns_both_legs():
+    reps = asyncio.run(Hedger(AppConfig(), ExecutionY(AppConfig())).hedge_fill(SELL, 100.0, 1.0))
+    assert [r.liquidity for r in reps] == ["taker", "maker"]
+    assert sum(r.filled for r in reps) == pytest.approx(100.0)
+
+def test_failed_leg_keeps_executed_reports():
+    cfg = AppConfig()
+    with pytest.raises(HedgeLegError) as ei:
+        asyncio.run(Hedger(cfg, _TakerDown(cfg)).hedge_fill(BUY, 100.0, 1.0))
+    assert [r.liquidity for r in ei.value.reports] == ["maker"]  # the maker leg did fill on Y
+    assert isinstance(ei.value.errors[0], ConnectionError)
@@ -1,6 +1,28 @@
-from cross_venue_mm.model.indicators import microprice
+from math import log
+from statistics import stdev
+import numpy as np
+from cross_venue_mm.model.indicators import microprice, microprice_batch, RollingVol, RollingVWAP
 from cross_venue_mm.plumbing.types import BookTop
 def test_microprice_biases_toward_imbalanced_side():
     b = BookTop(bid_px=100, bid_sz=200, ask_px=100.1, ask_sz=100, ts_ms=0)
     m = microprice(b)
-    assert m > (100+100.1)/2  # more bid depth -> microprice > mid
\ No newline at end of file
+    assert m > (100+100.1)/2  # more bid depth -> microprice > mid
+
+def test_microprice_batch_matches_scalar():
+    books = [BookTop(100, 200, 100.1, 100, 0), BookTop(100, 0, 100.2, 0, 1), BookTop(99.9, 5, 100.0, 50, 2)]
+    cols = [np.array([getattr(b, f) for b in books], dtype=float) for f in ("bid_px", "bid_sz", "ask_px", "ask_sz")]
+    assert np.allclose(microprice_batch(*cols), [microprice(b) for b in books])
+
+def test_rolling_vol_matches_window_stdev():
+    rv = RollingVol(window_secs=5)  # 5 returns at 1s steps
+    pxs = [100, 100.2, 99.9, 100.4, 100.1, 99.7, 100.3, 100.6, 100.0]
+    for px in pxs:
+        rv.update(px)
+    rets = [log(b/a) for a, b in zip(pxs, pxs[1:])][-5:]
+    assert abs(rv.sigma_bps() - stdev(rets)*1e4) < 1e-6
+
+def test_rolling_vwap_drops_evicted_trades():
+    vw = RollingVWAP(n_trades=2)
+    for px, sz in [(50.0, 10.0), (100.0, 1.0), (102.0, 1.0)]:
+        vw.update(px, sz)
+    assert abs(vw.value - 101.0) < 1e-9  # first trade is out of the window
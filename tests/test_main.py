@@ -0,0 +1,41 @@
+import asyncio
+import pytest
+from cross_venue_mm.main import _on_fill_x, _run_until_first_error
+from cross_venue_mm.plumbing.config import AppConfig
+from cross_venue_mm.plumbing.types import FillOnX, SELL
+from cross_venue_mm.plumbing.wiring import App
+from cross_venue_mm.execution_y import ExecutionY
+from cross_venue_mm.pnl import compute_pnl
+class _TakerDown(ExecutionY):
+    async def ioc_cross(self, side, qty, ref_px, max_slippage_bps):
+        raise ConnectionError("taker leg rejected")
+
+def test_failed_hedge_leg_books_executed_legs_and_continues(caplog):
+    app = App(AppConfig())
+    app.hedger.exec = _TakerDown(app.cfg)
+    fill = FillOnX(1.0, 100.0, SELL, 0, 3)
+    pnl = asyncio.run(_on_fill_x(app, fill))
+    maker_leg = asyncio.run(ExecutionY(app.cfg).post_maker(1, 1.0*(1 - 1e-4), 50.0))
+    assert pnl == compute_pnl(fill, [maker_leg])  # only the maker leg executed on Y
+    assert app.inv.qty == -100.0 and len(app.fills_x) == 1
+    assert "left 50 of 100 unhedged" in caplog.text
+
+@pytest.mark.parametrize("taskgroup", [True, False])
+def test_first_error_cancels_siblings(taskgroup, monkeypatch):
+    if not taskgroup:
+        monkeypatch.delattr(asyncio, "TaskGroup", raising=False)  # exercise the 3.10 gather path
+    cancelled = []
+    async def forever():
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+    async def fails():
+        await asyncio.sleep(0)
+        raise ValueError("feed died")
+    with pytest.raises(Exception) as ei:
+        asyncio.run(asyncio.wait_for(_run_until_first_error(forever(), fails()), 5))
+    errors = getattr(ei.value, "exceptions", (ei.value,))  # TaskGroup wraps in an ExceptionGroup
+    assert [type(e) for e in errors] == [ValueError]
+    assert cancelled == [True]
@@ -1,8 +1,33 @@
-from cross_venue_mm.pnl import compute_pnl
-from cross_venue_mm.plumbing.types import FillOnX
+import numpy as np
+import pytest
+from cross_venue_mm.pnl import compute_pnl, compute_pnl_batch
+from cross_venue_mm.plumbing.types import FillOnX, SELL, BUY
 from cross_venue_mm.execution_y import ExecReport
 def test_pnl_sell_then_buy_hedge():
-    fill = FillOnX(px=100.10, sz=100, side="sell", ts_ms=0, order_id="x")
+    fill = FillOnX.checked(px=100.10, sz=100, side=SELL, ts_ms=0, order_id=0)
     reps = [ExecReport(avg_px=100.05, filled=100, fee_bps=4.0, liquidity="taker")]
     pnl = compute_pnl(fill, reps)
-    assert pnl.gross_usd > 0 and pnl.net_usd < pnl.gross_usd  # fees deducted
\ No newline at end of file
+    assert pnl.gross_usd > 0 and pnl.net_usd < pnl.gross_usd  # fees deducted
+
+def test_pnl_batch_matches_scalar():
+    fills = [FillOnX.checked(px=100.10, sz=100, side=SELL, ts_ms=0, order_id=0),
+             FillOnX.checked(px=99.90, sz=10, side=BUY, ts_ms=1, order_id=1),
+             FillOnX.checked(px=99.95, sz=5, side=BUY, ts_ms=2, order_id=2)]
+    reps = [[ExecReport(100.05, 50, 4.0, "taker"), ExecReport(100.00, 50, 0.0, "maker")],
+            [],
+            [ExecReport(100.01, 5, 4.0, "taker")]]
+    flat = [r for rs in reps for r in rs]
+    gross, fees, net = compute_pnl_batch(
+        np.array([f.px for f in fills]), np.array([f.side for f in fills]),
+        np.array([r.avg_px for r in flat]), np.array([r.filled for r in flat]), np.array([r.fee_bps for r in flat]),
+        rep_offsets=np.array([0, 2, 2]),
+    )
+    for i, (f, rs) in enumerate(zip(fills, reps)):
+        pnl = compute_pnl(f, rs)
+        assert np.isclose(gross[i], pnl.gross_usd) and np.isclose(fees[i], pnl.fees_usd) and np.isclose(net[i], pnl.net_usd)
+
+def test_checked_fill_rejects_bad_fields():
+    with pytest.raises(ValueError):
+        FillOnX.checked(px=100.0, sz=0, side=SELL, ts_ms=0, order_id=0)
+    with pytest.raises(ValueError):
+        FillOnX.checked(px=100.0, sz=1, side="sell", ts_ms=0, order_id=0)
@@ -1,9 +1,40 @@
+import numpy as np
 from cross_venue_mm.model.quote_engine import QuoteEngine
 from cross_venue_mm.plumbing.config import AppConfig
-from cross_venue_mm.plumbing.types import BookTop
+from cross_venue_mm.plumbing.types import BookTop, BookTopBatch, booktop_array
 def test_quote_widens_with_sigma():
     qe = QuoteEngine(AppConfig())
     book = BookTop(100,10,100.1,10,0)
     q1 = qe.compute(book, sigma_bps=10, inv_skew_px=0.0, size_usd=25_000)
     q2 = qe.compute(book, sigma_bps=50, inv_skew_px=0.0, size_usd=25_000)
-    assert (q2.ask - q2.bid) > (q1.ask - q1.bid)
\ No newline at end of file
+    assert (q2.ask - q2.bid) > (q1.ask - q1.bid)
+
+def test_compute_batch_matches_scalar():
+    qe = QuoteEngine(AppConfig())
+    book = BookTop(100,10,100.1,10,0)
+    batch = BookTopBatch.empty(capacity=1)
+    batch.append(book); batch.append(book)  # forces a grow
+    bids, asks = qe.compute_batch(batch, sigma_bps=np.array([10.0, 50.0]), inv_skew_px=0.0, size_usd=25_000)
+    for i, sigma in enumerate((10, 50)):
+        q = qe.compute(book, sigma_bps=sigma, inv_skew_px=0.0, size_usd=25_000)
+        assert np.isclose(bids[i], q.bid) and np.isclose(asks[i], q.ask)
+    assert (asks[1] - bids[1]) > (asks[0] - bids[0])
+    out = np.empty(2)
+    q = qe.compute(book, sigma_bps=10, inv_skew_px=0.0, size_usd=25_000)
+    assert np.allclose(qe.compute_into(book, 10, 0.0, 25_000, out), [q.bid, q.ask])
+
+def test_compute_batch_float32_close_to_float64():
+    qe = QuoteEngine(AppConfig())
+    rng = np.random.default_rng(0)
+    n = 1_000_000
+    tick = 1e-4  # SUIUSDT price tick
+    mid = rng.uniform(0.5, 5.0, n)
+    recs = booktop_array(n)
+    recs["bid_px"], recs["ask_px"] = mid*(1 - 2e-4), mid*(1 + 2e-4)
+    recs["bid_sz"], recs["ask_sz"] = rng.uniform(0, 5e4, n), rng.uniform(0, 5e4, n)
+    sigma = rng.uniform(0, 80, n)
+    b64, a64 = qe.compute_batch(BookTopBatch.from_array(recs), sigma, 0.0, 25_000)
+    b32, a32 = qe.compute_batch(BookTopBatch.from_array(recs, dtype=np.float32), sigma, 0.0, 25_000)
+    assert b32.dtype == np.float32
+    # float32 spacing near 5.0 is ~5e-7, so 1e-5 of a tick is unreachable; hold it to 5% of a tick
+    assert np.max(np.abs(b32 - b64)) < 0.05*tick and np.max(np.abs(a32 - a64)) < 0.05*tick
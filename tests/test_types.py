@@ -0,0 +1,41 @@
+import numpy as np
+from cross_venue_mm.plumbing.types import (BookTop, BookTopBatch, Trade, FillOnX, OrderIdTable, BUY, SELL,
+                                           BOOKTOP_DT, booktop_array, as_record, from_record)
+def test_records_round_trip_through_dtypes():
+    for x in (BookTop(0.9876, 1500.0, 0.9881, 20.5, 1_700_000_000_123),
+              Trade(0.9879, 12.0, SELL, 1_700_000_000_456),
+              FillOnX(0.9880, 250.0, SELL, 1_700_000_000_789, 7),
+              FillOnX(0.9870, 10.0, BUY, 1_700_000_000_790, 8)):
+        rec = as_record(x)
+        assert from_record(rec, type(x)) == x
+    assert as_record(Trade(1.0, 1.0, SELL, 0))["side"] == -1  # signed i1 survives
+
+def test_booktop_array_layout():
+    recs = booktop_array(3)
+    assert recs.dtype == BOOKTOP_DT and len(recs) == 3
+    recs[1] = as_record(BookTop(1.0, 2.0, 1.1, 3.0, 4))
+    assert from_record(recs[1], BookTop) == BookTop(1.0, 2.0, 1.1, 3.0, 4)
+    assert np.all(recs["ts_ms"][[0, 2]] == 0)
+
+def test_order_id_table_interns_and_resolves():
+    t = OrderIdTable()
+    a, b = t.intern("x-1001"), t.intern("x-1002")
+    assert (a, b) == (0, 1)
+    assert t.intern("x-1001") == a  # idempotent
+    assert t.resolve(b) == "x-1002"
+    f = FillOnX.new(0.988, 250.0, SELL, 5, "x-1002", t)
+    assert f == FillOnX(0.988, 250.0, SELL, 5, b)
+    assert t.resolve(f.order_id) == "x-1002"
+
+def test_booktop_batch_from_records_matches_append():
+    books = [BookTop(0.9876, 1500.0, 0.9881, 20.5, 1), BookTop(0.9877, 0.0, 0.9880, 7.25, 2),
+             BookTop(0.9875, 3.5, 0.9882, 1e4, 3)]
+    for dt in (np.float64, np.float32):
+        built = BookTopBatch.from_records(books, dtype=dt)
+        appended = BookTopBatch.empty(capacity=1, dtype=dt)
+        for b in books:
+            appended.append(b)
+        assert len(built) == len(appended) == 3 and built.dtype == appended.dtype == dt
+        for f in ("bid_px", "bid_sz", "ask_px", "ask_sz", "ts_ms"):
+            assert np.array_equal(getattr(built, f)[:3], getattr(appended, f)[:3])
+        assert built.ts_ms.dtype == np.int64
@@ -0,0 +1,22 @@
+import asyncio
+import time
+import numpy as np
+from cross_venue_mm.plumbing.utils import AsyncRateLimiter, RingBuffer
+def test_rate_limiter_throttles_after_burst():
+    async def run():
+        limiter = AsyncRateLimiter(5, 0.1)  # 5 per 100ms
+        t0 = time.monotonic()
+        for _ in range(10):
+            async with limiter:
+                pass
+        return time.monotonic() - t0
+    elapsed = asyncio.run(run())
+    assert 0.08 <= elapsed < 0.5  # burst of 5 free, next 5 paced at 20ms each
+
+def test_ring_buffer_recent_in_push_order():
+    rb = RingBuffer(4, np.dtype([("px", "f8")]))
+    for px in range(6):
+        rb.push((float(px),))
+    assert len(rb) == 4
+    assert rb.recent()["px"].tolist() == [2.0, 3.0, 4.0, 5.0]
+    assert rb.recent(3)["px"].tolist() == [3.0, 4.0, 5.0]
@@ -0,0 +1,47 @@
+import asyncio
+import pytest
+from cross_venue_mm.plumbing.types import BUY, SELL
+from cross_venue_mm.venue_x_maker import VenueXMaker
+class _AskRejected(VenueXMaker):
+    async def _post_or_replace(self, side, px, qty):
+        if side == SELL:
+            raise ConnectionError("ask rejected")
+        return "bid-1"
+
+def test_placed_leg_is_tracked_when_other_leg_fails():
+    mk = _AskRejected("SUIUSDT", 5)
+    with pytest.raises(ConnectionError):
+        asyncio.run(mk.upsert_quotes(0.99, 1.01, 100.0))
+    assert mk.live.bid_order_id == "bid-1"  # still visible to cancel_all
+    assert mk.live.ask_order_id is None
+
+class _Counting(VenueXMaker):
+    sent = 0
+    async def _post_or_replace(self, side, px, qty):
+        self.sent += 1
+        return f"oid{self.sent}"
+
+def test_epsilon_gate_skip_move_and_reset():
+    async def run():
+        mk = _Counting("SUIUSDT", 5, epsilon_move_bps=1.0)
+        await mk.upsert_quotes(0.99, 1.01, 100.0)
+        await mk.upsert_quotes(0.99*(1+5e-5), 1.01, 100.0)  # 0.5 bps: skipped
+        assert mk.sent == 2
+        await mk.upsert_quotes(0.99*(1+2e-4), 1.01, 100.0)  # 2 bps: requoted
+        assert mk.sent == 4
+        mk.on_fill(BUY)  # bid taken: the next quote must go out even though prices are unchanged
+        await mk.upsert_quotes(0.99*(1+2e-4), 1.01, 100.0)
+        assert mk.sent == 6
+        await mk.cancel_all()
+        await mk.upsert_quotes(0.99*(1+2e-4), 1.01, 100.0)
+        assert mk.sent == 8
+    asyncio.run(run())
+
+def test_failed_replace_reopens_epsilon_gate():
+    async def run():
+        mk = _AskRejected("SUIUSDT", 5, epsilon_move_bps=1.0)
+        mk._last_bid, mk._last_ask, mk._last_size = 0.99, 1.01, 100.0
+        with pytest.raises(ConnectionError):
+            await mk.upsert_quotes(0.98, 1.01, 100.0)
+        assert not mk._within_epsilon(0.99, 1.01, 100.0)
+    asyncio.run(run())